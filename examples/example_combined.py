@@ -11,7 +11,7 @@ import os
 from langchain.tools import tool
 from langchain.agents import create_agent
 
-from langchain_velatir import VelatirGuardrailMiddleware, VelatirHITLMiddleware
+from langchain_velatir import get_guardrail_middleware, get_hitl_middleware
 
 
 # Define example tools
@@ -36,36 +36,33 @@ def execute_transaction(amount: float, account: str) -> str:
 async def main():
     """Run the combined example."""
     # Get API keys from environment
-    velatir_api_key = os.getenv("VELATIR_API_KEY")
-
-    if not velatir_api_key:
-        print("Please set VELATIR_API_KEY environment variable")
-        return
-    if not openai_api_key:
-        print("Please set OPENAI_API_KEY environment variable")
+    required = ("VELATIR_API_KEY", "OPENAI_API_KEY")
+    missing = [key for key in required if not os.environ.get(key)]
+    if missing:
+        print(f"Please set the {', '.join(missing)} environment variable(s)")
         return
+    velatir_api_key = os.environ["VELATIR_API_KEY"]
 
-    # Create both middleware components
-    guardrail_middleware = VelatirGuardrailMiddleware(
+    # Create both middleware components (cached per configuration, so
+    # repeated agent construction reuses the same instances)
+    guardrail_middleware = get_guardrail_middleware(
         api_key=velatir_api_key,
         mode="blocking",
         blocked_message="This response was blocked due to compliance violations.",
     )
 
-    hitl_middleware = VelatirHITLMiddleware(
+    hitl_middleware = get_hitl_middleware(
         api_key=velatir_api_key,
         polling_interval=5.0,
         timeout=600.0,
-        require_approval_for=["process_customer_data", "execute_transaction"],
+        require_approval_for=("process_customer_data", "execute_transaction"),
     )
 
     # Create the agent with both middleware components
     tools = [process_customer_data, generate_report, execute_transaction]
 
     agent = create_agent(
-        model="openai:o3-mini",
-        tools=tools,
-        middleware=[guardrail_middleware, hitl_middleware]
+        model="openai:o3-mini", tools=tools, middleware=[guardrail_middleware, hitl_middleware]
     )
 
     print("Example: Combined Guardrails + Human-in-the-Loop")
@@ -84,9 +81,16 @@ async def main():
     print("\nRunning agent with combined guardrails and HITL middleware...\n")
 
     # Run a comprehensive example that exercises both middleware
-    result = agent.invoke({
-        "messages": [{"role": "user", "content": "Please process customer data for customer CUST-001 to update their email address to john.doe@example.com"}]
-    })
+    result = agent.invoke(
+        {
+            "messages": [
+                {
+                    "role": "user",
+                    "content": "Please process customer data for customer CUST-001 to update their email address to john.doe@example.com",
+                }
+            ]
+        }
+    )
 
     print("\n" + "=" * 50)
     print("Agent completed!")
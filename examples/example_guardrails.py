@@ -10,7 +10,7 @@ import os
 
 from langchain.tools import tool
 from langchain.agents import create_agent
-from langchain_velatir import VelatirGuardrailMiddleware
+from langchain_velatir import get_guardrail_middleware
 
 
 # Define some example tools
@@ -29,32 +29,36 @@ def send_email(to: str, subject: str, body: str) -> str:
 async def main():
     """Run the guardrail example."""
     # Get API keys from environment
-    velatir_api_key = os.getenv("VELATIR_API_KEY")
-   
-    if not velatir_api_key:
-        print("Please set VELATIR_API_KEY environment variable")
-        return
-    if not openai_api_key:
-        print("Please set OPENAI_API_KEY environment variable")
+    required = ("VELATIR_API_KEY", "OPENAI_API_KEY")
+    missing = [key for key in required if not os.environ.get(key)]
+    if missing:
+        print(f"Please set the {', '.join(missing)} environment variable(s)")
         return
+    velatir_api_key = os.environ["VELATIR_API_KEY"]
 
     agent = create_agent(
         model="openai:o3-mini",
         tools=[search_database, send_email],
         middleware=[
-            VelatirGuardrailMiddleware(
+            get_guardrail_middleware(
                 api_key=velatir_api_key,
                 mode="blocking",
                 blocked_message="This response was blocked due to compliance violations.",
             )
-        ]
+        ],
     )
 
     # When user provides PII, it will be handled according to the strategy
-    result = agent.invoke({
-        "messages": [{"role": "user", "content": "My email is john.doe@example.com and card is 4532-1234-5678-9010"}]
-    })
-        
+    result = agent.invoke(
+        {
+            "messages": [
+                {
+                    "role": "user",
+                    "content": "My email is john.doe@example.com and card is 4532-1234-5678-9010",
+                }
+            ]
+        }
+    )
 
 
 if __name__ == "__main__":
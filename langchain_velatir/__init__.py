@@ -4,12 +4,14 @@ LangChain integration for Velatir.
 Provides middleware for AI governance, compliance, and human-in-the-loop workflows.
 """
 
+import functools
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from langchain_velatir.middleware import VelatirGuardrailMiddleware, VelatirHITLMiddleware
+
 __version__ = "0.1.0"
 
-from langchain_velatir.middleware import (
-    VelatirGuardrailMiddleware,
-    VelatirHITLMiddleware,
-)
 from langchain_velatir.exceptions import (
     VelatirMiddlewareError,
     VelatirPolicyViolationError,
@@ -24,4 +26,70 @@ __all__ = [
     "VelatirPolicyViolationError",
     "VelatirApprovalDeniedError",
     "VelatirTimeoutError",
+    "get_guardrail_middleware",
+    "get_hitl_middleware",
 ]
+
+
+@functools.lru_cache(maxsize=64)
+def get_guardrail_middleware(
+    api_key: str,
+    mode: str = "blocking",
+    base_url: Optional[str] = None,
+    blocked_message: str = "This response requires review and was not approved.",
+) -> "VelatirGuardrailMiddleware":
+    """
+    Return a cached VelatirGuardrailMiddleware for this configuration.
+
+    Server environments that build a fresh agent per request can call this
+    instead of the constructor so repeat configurations reuse one middleware
+    instance (and its pooled HTTP client). The returned instance is shared:
+    mutating it affects every caller using the same arguments.
+    """
+    from langchain_velatir.middleware import VelatirGuardrailMiddleware
+
+    return VelatirGuardrailMiddleware(
+        api_key=api_key,
+        mode=mode,
+        base_url=base_url,
+        blocked_message=blocked_message,
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def get_hitl_middleware(
+    api_key: str,
+    base_url: Optional[str] = None,
+    polling_interval: float = 5.0,
+    timeout: float = 600.0,
+    require_approval_for: Optional[tuple[str, ...]] = None,
+) -> "VelatirHITLMiddleware":
+    """
+    Return a cached VelatirHITLMiddleware for this configuration.
+
+    All arguments must be hashable, so require_approval_for takes a tuple of
+    tool names rather than a list. The returned instance is shared: mutating
+    it affects every caller using the same arguments.
+    """
+    from langchain_velatir.middleware import VelatirHITLMiddleware
+
+    return VelatirHITLMiddleware(
+        api_key=api_key,
+        base_url=base_url,
+        polling_interval=polling_interval,
+        timeout=timeout,
+        require_approval_for=list(require_approval_for) if require_approval_for else None,
+    )
+
+
+# Middleware (and transitively the Velatir SDK) is imported lazily via PEP 562
+# so that exception-only imports don't pay the SDK's cold-start cost
+_MIDDLEWARE_EXPORTS = frozenset({"VelatirGuardrailMiddleware", "VelatirHITLMiddleware"})
+
+
+def __getattr__(name: str) -> Any:
+    if name in _MIDDLEWARE_EXPORTS:
+        from langchain_velatir import middleware
+
+        return getattr(middleware, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,46 @@
+"""Compatibility shims for optional LangChain / LangGraph imports.
+
+The AgentMiddleware base class and hook_config decorator have moved between
+LangChain releases. Resolving them here means the failing-import probe walks
+its fallback chain at most once per process; every other module just imports
+the resolved names from this one.
+"""
+
+# Import AgentMiddleware and hook_config from langchain
+try:
+    from langchain.agents.middleware import AgentMiddleware, hook_config
+except ImportError:
+    # Fallback for older LangChain versions
+    try:
+        from langchain.agents import AgentMiddleware, hook_config
+    except ImportError:
+        try:
+            from langchain_core.agents import AgentMiddleware, hook_config
+        except ImportError:
+            # Define placeholder for type hints if not available
+            class AgentMiddleware:  # type: ignore
+                """Placeholder for AgentMiddleware base class."""
+
+                pass
+
+            def hook_config(**kwargs):  # type: ignore
+                """Placeholder for hook_config decorator."""
+
+                def decorator(func):
+                    return func
+
+                return decorator
+
+
+# Import Runtime type
+try:
+    from langgraph.runtime import Runtime
+except ImportError:
+    # Fallback placeholder if not available
+    class Runtime:  # type: ignore
+        """Placeholder for Runtime type if not available in imports."""
+
+        pass
+
+
+__all__ = ["AgentMiddleware", "hook_config", "Runtime"]
@@ -1,21 +1,221 @@
 """Velatir API client wrapper for LangChain integration."""
 
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import json
+import random
+import sqlite3
+import threading
 import time
-from typing import Any, Optional
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal, Optional
+
+if TYPE_CHECKING:
+    from velatir.models import TraceResponse, VelatirResponse
 
 try:
-    import velatir
-    from velatir import Client as VelatirSDKClient
-    from velatir.models import VelatirResponse, TraceResponse
+    import orjson
 except ImportError:
-    # For testing when velatir SDK is not installed
-    try:
-        from tests import mock_velatir as velatir  # type: ignore
-        from tests.mock_velatir import Client as VelatirSDKClient, VelatirResponse, TraceResponse  # type: ignore
-    except ImportError:
-        raise ImportError("velatir SDK is required. Install it with: pip install velatir")
+    orjson = None  # type: ignore[assignment]
+
+from langchain_velatir.exceptions import VelatirMiddlewareError, VelatirTimeoutError
+
+CacheMode = Literal["enabled", "readonly", "writeonly", "replay", "disabled"]
+
+# SDK module and client class, imported lazily on first VelatirClient
+# construction so that `import langchain_velatir` stays cheap
+_SDK: Optional[tuple[Any, Any]] = None
+
+
+def _load_sdk() -> tuple[Any, Any]:
+    """Import the Velatir SDK on first use and cache the result."""
+    global _SDK
+    if _SDK is None:
+        try:
+            import velatir
+            from velatir import Client as sdk_client_cls
+        except ImportError:
+            # For testing when velatir SDK is not installed
+            try:
+                from tests import mock_velatir as velatir  # type: ignore
+                from tests.mock_velatir import Client as sdk_client_cls  # type: ignore
+            except ImportError:
+                raise ImportError("velatir SDK is required. Install it with: pip install velatir")
+        _SDK = (velatir, sdk_client_cls)
+    return _SDK
+
+
+# Longest wait hint passed to the server when long-polling status changes
+_LONG_POLL_MAX = 25.0
+
+# Process-wide pool of SDK clients keyed by connection-relevant settings, so
+# that several VelatirClient instances (e.g. guardrail + HITL middleware with
+# the same credentials) share one HTTP connection pool instead of each opening
+# their own. Note that differing base_url/timeout values fragment the pool.
+_SDK_CLIENT_POOL: dict[tuple[Any, ...], Any] = {}
+_SDK_CLIENT_REFCOUNTS: dict[tuple[Any, ...], int] = {}
+_SDK_POOL_LOCK = threading.Lock()
+
+# Strong references to close() tasks scheduled from __del__, so the GC
+# fallback isn't itself collected before it runs
+_CLOSE_TASKS: set["asyncio.Task[None]"] = set()
+
+
+def _freeze(obj: Any) -> Any:
+    """Recursively convert a JSON-like value into a hashable, canonical form.
+
+    Dicts are tagged so that a dict and a list of key/value pairs never
+    canonicalize to the same value. Numeric scalars are tagged with their
+    type name because True, 1 and 1.0 compare (and hash) equal in Python yet
+    serialize to distinct JSON payloads, and frozen values are used as cache
+    keys — they must not share an entry.
+    """
+    if isinstance(obj, dict):
+        return ("__map__", tuple(sorted((str(k), _freeze(v)) for k, v in obj.items())))
+    if isinstance(obj, (list, tuple)):
+        return tuple(_freeze(v) for v in obj)
+    if isinstance(obj, (bool, int, float)):
+        return ("__scalar__", type(obj).__name__, obj)
+    if obj is None or isinstance(obj, str):
+        return obj
+    return str(obj)
+
+
+def _thaw(frozen: Any) -> Any:
+    """Invert _freeze back into plain JSON-serializable containers."""
+    if isinstance(frozen, tuple):
+        if len(frozen) == 3 and frozen[0] == "__scalar__":
+            return frozen[2]
+        if len(frozen) == 2 and frozen[0] == "__map__":
+            return {key: _thaw(value) for key, value in frozen[1]}
+        return [_thaw(value) for value in frozen]
+    return frozen
+
+
+def _dumps(value: Any) -> bytes:
+    """Compact sorted-key JSON encoding, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_SORT_KEYS, default=str)
+    return json.dumps(
+        value, sort_keys=True, default=str, separators=(",", ":"), ensure_ascii=False
+    ).encode()
+
+
+@functools.lru_cache(maxsize=256)
+def _canonical_bytes(frozen: Any) -> bytes:
+    """Serialize a frozen payload once; repeat payloads reuse the cached bytes."""
+    return _dumps(_thaw(frozen))
+
+
+def _dedup_key(
+    function_name: str,
+    args: dict[str, Any],
+    doc: Optional[str],
+    parent_review_task_id: Optional[str],
+) -> str:
+    """Build a canonical SHA-256 key for a review task creation request."""
+    frozen = (function_name, _freeze(args), doc, parent_review_task_id)
+    return hashlib.sha256(_canonical_bytes(frozen)).hexdigest()
+
+
+# Review task states that carry a final decision, normalized to lowercase
+# without underscores so SDK enum spellings and raw strings compare equal
+_TERMINAL_STATES: frozenset[str] = frozenset(
+    {"approved", "denied", "rejected", "changerequested", "error", "timeout"}
+)
+
+
+def _is_terminal(response: VelatirResponse) -> bool:
+    """Check whether a review task response carries a final decision."""
+    state = getattr(response, "state", None)
+    value = str(getattr(state, "value", state)).lower().replace("_", "")
+    return value in _TERMINAL_STATES
+
+
+class _CachedDecision:
+    """Review decision rehydrated from the local decision cache.
+
+    Mirrors the response attributes the middleware consumes without needing to
+    reconstruct an SDK model.
+    """
+
+    __slots__ = ("review_task_id", "state", "requested_change")
+
+    def __init__(self, review_task_id: str, state: str, requested_change: Optional[str] = None):
+        self.review_task_id = review_task_id
+        self.state = state
+        self.requested_change = requested_change
+
+    def _normalized_state(self) -> str:
+        return str(self.state).lower().replace("_", "")
+
+    @property
+    def is_approved(self) -> bool:
+        return self._normalized_state() == "approved"
+
+    @property
+    def is_denied(self) -> bool:
+        return self._normalized_state() == "denied"
+
+    @property
+    def is_change_requested(self) -> bool:
+        return self._normalized_state() == "changerequested"
+
+    @property
+    def is_rejected(self) -> bool:
+        return self._normalized_state() in {"denied", "rejected", "changerequested"}
+
+    @property
+    def is_pending(self) -> bool:
+        return False
+
+
+class _DecisionStore:
+    """SQLite-backed store of terminal review decisions keyed by request hash."""
+
+    def __init__(self, path: Path):
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS decisions ("
+            "hash TEXT PRIMARY KEY, function_name TEXT, review_task_id TEXT, "
+            "state TEXT, requested_change TEXT, ts REAL)"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def lookup(self, key: str) -> Optional[_CachedDecision]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT review_task_id, state, requested_change FROM decisions WHERE hash = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        return _CachedDecision(review_task_id=row[0], state=row[1], requested_change=row[2])
 
-from langchain_velatir.exceptions import VelatirTimeoutError
+    def store(
+        self,
+        key: str,
+        function_name: str,
+        review_task_id: str,
+        state: str,
+        requested_change: Optional[str],
+    ) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO decisions VALUES (?, ?, ?, ?, ?, ?)",
+                (key, function_name, review_task_id, state, requested_change, time.time()),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
 
 
 class VelatirClient:
@@ -33,6 +233,11 @@ class VelatirClient:
         timeout: float = 10.0,
         max_retries: int = 3,
         retry_backoff: float = 0.5,
+        status_cache_ttl: float = 0.25,
+        status_cache_size: int = 1024,
+        dedup_create: bool = True,
+        cache_mode: CacheMode = "enabled",
+        cache_path: Optional[Path] = None,
     ):
         """
         Initialize the Velatir client wrapper.
@@ -43,21 +248,111 @@ class VelatirClient:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries for failed requests
             retry_backoff: Base backoff time in seconds for retries
+            status_cache_ttl: Seconds to cache non-terminal review task statuses.
+                Terminal statuses are immutable and cached without expiry.
+                Set to 0 to cache only terminal statuses.
+            status_cache_size: Maximum number of cached statuses (LRU eviction)
+            dedup_create: Deduplicate identical create_review_task calls while
+                the original task is still in flight (agent retry loops often
+                replay the same tool call verbatim)
+            cache_mode: Policy for the local on-disk decision cache: "enabled"
+                reads and writes, "readonly" only serves stored decisions,
+                "writeonly" only records them, "replay" serves stored decisions
+                and raises on a miss (deterministic, zero-API test runs), and
+                "disabled" bypasses the cache. Inactive unless cache_path is set.
+            cache_path: Path to the SQLite decision cache. None (the default)
+                disables the on-disk cache regardless of cache_mode.
         """
         self.api_key = api_key
         self.base_url = base_url
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_backoff = retry_backoff
+        self.status_cache_ttl = status_cache_ttl
+        self.status_cache_size = status_cache_size
+        self.dedup_create = dedup_create
+        self.cache_mode = cache_mode
+        self._decisions = (
+            _DecisionStore(cache_path)
+            if cache_path is not None and cache_mode != "disabled"
+            else None
+        )
+        # Maps review_task_id -> (request hash, function_name) for in-flight
+        # tasks whose eventual decision should be recorded in the store
+        self._pending_decisions: dict[str, tuple[str, str]] = {}
 
-        # Initialize the underlying Velatir SDK client
-        self._client = VelatirSDKClient(
-            api_key=api_key,
-            base_url=base_url,
-            timeout=timeout,
-            max_retries=max_retries,
-            retry_backoff=retry_backoff,
+        # Status cache maps review_task_id -> (expiry, response); expiry is None
+        # for terminal states. Per-key locks coalesce concurrent pollers so only
+        # one request per task is in flight at a time (single-flight).
+        self._status_cache: OrderedDict[str, tuple[Optional[float], VelatirResponse]] = (
+            OrderedDict()
+        )
+        self._status_locks: dict[str, asyncio.Lock] = {}
+
+        # Dedup cache maps canonical request hash -> creation response, so that
+        # identical create calls reuse the in-flight task instead of POSTing
+        self._task_dedup: OrderedDict[str, VelatirResponse] = OrderedDict()
+
+        # Guards the in-memory caches above: the sync methods run on whatever
+        # worker thread executes the hooks, and a shared middleware instance
+        # may mix those with event-loop callers. Reentrant because the dedup
+        # lookup consults the status cache while holding it.
+        self._cache_lock = threading.RLock()
+
+        # One shared future per review task being waited on; concurrent
+        # wait_for_approval calls join it instead of polling independently.
+        # The waiter counts and poller handles let the last waiter to abandon
+        # a task (timeout/cancellation) tear its background poller down
+        self._waiters: dict[str, asyncio.Future[VelatirResponse]] = {}
+        self._waiter_counts: dict[str, int] = {}
+        self._poller_tasks: dict[str, asyncio.Task[None]] = {}
+
+        # Events that notify_complete() sets to interrupt a poller mid-sleep
+        self._completion_events: dict[str, asyncio.Event] = {}
+
+        # Whether the SDK accepts a long-poll `wait` hint; probed on first use
+        self._supports_long_poll: Optional[bool] = None
+
+        self._closed = False
+
+        # Initialize the underlying Velatir SDK client (imported lazily).
+        # Clients with identical connection settings are shared process-wide
+        # so that multiple middleware instances reuse one HTTP pool.
+        self._sdk, sdk_client_cls = _load_sdk()
+        self._pool_key: tuple[Any, ...] = (
+            base_url,
+            hashlib.sha256(api_key.encode()).hexdigest()[:16],
+            timeout,
+            max_retries,
+            retry_backoff,
         )
+        with _SDK_POOL_LOCK:
+            client = _SDK_CLIENT_POOL.get(self._pool_key)
+            if client is None:
+                client = self._build_sdk_client(
+                    sdk_client_cls,
+                    api_key=api_key,
+                    base_url=base_url,
+                    timeout=timeout,
+                    max_retries=max_retries,
+                    retry_backoff=retry_backoff,
+                )
+                _SDK_CLIENT_POOL[self._pool_key] = client
+            _SDK_CLIENT_REFCOUNTS[self._pool_key] = _SDK_CLIENT_REFCOUNTS.get(self._pool_key, 0) + 1
+        self._client = client
+
+    @staticmethod
+    def _build_sdk_client(sdk_client_cls: Any, **kwargs: Any) -> Any:
+        """Construct an SDK client, requesting HTTP/2 when the SDK supports it.
+
+        HTTP/2 lets the polling loop multiplex status checks over a single
+        connection. Older SDK versions reject the flag, so probe and fall
+        back to the plain constructor.
+        """
+        try:
+            return sdk_client_cls(http2=True, **kwargs)
+        except TypeError:
+            return sdk_client_cls(**kwargs)
 
     async def create_review_task(
         self,
@@ -82,7 +377,20 @@ class VelatirClient:
         Returns:
             VelatirResponse with review_task_id and state
         """
-        return await self._client.create_review_task(
+        key = None
+        if self.dedup_create or self._decisions is not None:
+            key = _dedup_key(function_name, args, doc, parent_review_task_id)
+        if self.dedup_create and key is not None:
+            cached = self._dedup_lookup(key)
+            if cached is not None:
+                return cached
+        if key is not None:
+            decision = self._decision_lookup(key, function_name)
+            if decision is not None:
+                self._status_cache_store(decision.review_task_id, decision)
+                return decision
+
+        response = await self._client.create_review_task(
             function_name=function_name,
             args=args,
             doc=doc,
@@ -90,32 +398,230 @@ class VelatirClient:
             metadata=metadata,
             parent_review_task_id=parent_review_task_id,
         )
+        if key is not None:
+            if self.dedup_create:
+                self._dedup_store(key, response)
+            if self._decisions is not None:
+                self._pending_decisions[response.review_task_id] = (key, function_name)
+        return response
 
-    async def get_review_task_status(self, review_task_id: str) -> VelatirResponse:
+    async def create_review_tasks(self, tasks: list[dict[str, Any]]) -> list[VelatirResponse]:
+        """
+        Create several review tasks in one round-trip where possible.
+
+        Uses the SDK's batch create endpoint when available, so the N tool
+        calls of one model turn cost a single POST instead of N. On SDKs
+        without a batch endpoint, the tasks are created concurrently and each
+        one still goes through the per-task dedup and decision caches.
+
+        Args:
+            tasks: Keyword-argument dicts accepted by create_review_task
+
+        Returns:
+            List of VelatirResponse objects, in the same order as the tasks
+        """
+        batch = getattr(self._client, "create_review_tasks", None)
+        if batch is not None:
+            return list(await batch(tasks))
+
+        return list(await asyncio.gather(*[self.create_review_task(**task) for task in tasks]))
+
+    def _decision_lookup(self, key: str, function_name: str) -> Optional[_CachedDecision]:
+        """Serve a stored terminal decision for this request, if allowed.
+
+        Raises:
+            VelatirMiddlewareError: On a cache miss in replay mode
+        """
+        if self._decisions is None or self.cache_mode not in ("enabled", "readonly", "replay"):
+            return None
+        decision = self._decisions.lookup(key)
+        if decision is None and self.cache_mode == "replay":
+            raise VelatirMiddlewareError(
+                f"Decision cache miss in replay mode for function '{function_name}'"
+            )
+        return decision
+
+    def _decision_record(self, review_task_id: str, response: VelatirResponse) -> None:
+        """Persist a terminal decision for a task created through this client."""
+        if self._decisions is None or self.cache_mode not in ("enabled", "writeonly"):
+            return
+        pending = self._pending_decisions.pop(review_task_id, None)
+        if pending is None:
+            return
+        key, function_name = pending
+        state = getattr(response, "state", None)
+        self._decisions.store(
+            key,
+            function_name,
+            review_task_id,
+            str(getattr(state, "value", state)),
+            getattr(response, "requested_change", None),
+        )
+
+    def _dedup_lookup(self, key: str) -> Optional[VelatirResponse]:
+        """Return the in-flight task for a canonical request hash, if any.
+
+        Entries whose task has reached a terminal state are dropped so that a
+        genuinely new request (after the previous one resolved) POSTs again.
+        """
+        with self._cache_lock:
+            response = self._task_dedup.get(key)
+            if response is None:
+                return None
+            current = self._status_cache_lookup(getattr(response, "review_task_id", ""))
+            if current is not None and _is_terminal(current):
+                del self._task_dedup[key]
+                return None
+            self._task_dedup.move_to_end(key)
+            return response
+
+    def _dedup_store(self, key: str, response: VelatirResponse) -> None:
+        """Remember the creation response for a canonical request hash."""
+        with self._cache_lock:
+            self._task_dedup[key] = response
+            self._task_dedup.move_to_end(key)
+            while len(self._task_dedup) > self.status_cache_size:
+                self._task_dedup.popitem(last=False)
+
+    def _status_cache_lookup(self, review_task_id: str) -> Optional[VelatirResponse]:
+        """Return a cached status if present and not expired."""
+        with self._cache_lock:
+            entry = self._status_cache.get(review_task_id)
+            if entry is None:
+                return None
+            expires_at, response = entry
+            if expires_at is not None and time.monotonic() >= expires_at:
+                del self._status_cache[review_task_id]
+                return None
+            self._status_cache.move_to_end(review_task_id)
+            return response
+
+    def _status_cache_store(self, review_task_id: str, response: VelatirResponse) -> None:
+        """Cache a status response; terminal states never expire."""
+        if _is_terminal(response):
+            expires_at = None
+            # Terminal decisions flow through here from every wait/status path,
+            # making this the one choke point for the on-disk decision cache
+            self._decision_record(review_task_id, response)
+        else:
+            expires_at = time.monotonic() + self.status_cache_ttl
+        with self._cache_lock:
+            self._status_cache[review_task_id] = (expires_at, response)
+            self._status_cache.move_to_end(review_task_id)
+            while len(self._status_cache) > self.status_cache_size:
+                self._status_cache.popitem(last=False)
+
+    async def get_review_task_status(
+        self, review_task_id: str, wait: Optional[float] = None
+    ) -> VelatirResponse:
         """
         Get the current status of a review task.
 
+        Statuses are served from a short-TTL in-process cache so that several
+        middleware components polling the same task in one tick share a single
+        request. Terminal statuses are immutable and cached indefinitely.
+
         Args:
             review_task_id: ID of the review task
+            wait: Optional long-poll hint in seconds; when the SDK supports it
+                the server holds the request until the state changes or the
+                hint expires, instead of returning the current state at once
 
         Returns:
             VelatirResponse with current state
         """
-        return await self._client.get_review_task_status(review_task_id)
+        cached = self._status_cache_lookup(review_task_id)
+        if cached is not None:
+            return cached
+
+        lock = self._status_locks.setdefault(review_task_id, asyncio.Lock())
+        try:
+            async with lock:
+                # Re-check after acquiring: another poller may have refreshed it
+                cached = self._status_cache_lookup(review_task_id)
+                if cached is not None:
+                    return cached
+                if wait is not None and self._supports_long_poll is not False:
+                    try:
+                        response = await self._client.get_review_task_status(
+                            review_task_id, wait=wait
+                        )
+                        self._supports_long_poll = True
+                    except TypeError:
+                        # SDK predates the long-poll hint; fall back permanently
+                        self._supports_long_poll = False
+                        response = await self._client.get_review_task_status(review_task_id)
+                else:
+                    response = await self._client.get_review_task_status(review_task_id)
+                self._status_cache_store(review_task_id, response)
+                return response
+        finally:
+            # Drop the lock entry once it is idle — also on SDK errors, so
+            # erroring task IDs don't accumulate. A contended lock stays
+            # registered for the coroutines queued on it, preserving the
+            # single-flight guarantee.
+            if self._status_locks.get(review_task_id) is lock and not lock.locked():
+                del self._status_locks[review_task_id]
+
+    async def get_review_task_statuses(self, review_task_ids: list[str]) -> list[VelatirResponse]:
+        """
+        Get the current status of several review tasks at once.
+
+        Uses the SDK's bulk status endpoint when available, so N in-flight
+        approvals cost one API call per poll tick instead of N. On SDKs
+        without a bulk endpoint, the individual lookups are issued
+        concurrently and still share the pooled connection and status cache.
+
+        Args:
+            review_task_ids: IDs of the review tasks
+
+        Returns:
+            List of VelatirResponse objects, in the same order as the IDs
+        """
+        bulk = getattr(self._client, "get_review_task_statuses", None)
+        if bulk is not None:
+            # Serve what we can from the cache and only fetch the rest
+            cached = {i: self._status_cache_lookup(i) for i in review_task_ids}
+            missing = [i for i, response in cached.items() if response is None]
+            if missing:
+                for response in await bulk(missing):
+                    self._status_cache_store(response.review_task_id, response)
+                    cached[response.review_task_id] = response
+            return [cached[i] for i in review_task_ids]
+
+        return list(
+            await asyncio.gather(*[self.get_review_task_status(i) for i in review_task_ids])
+        )
 
     async def wait_for_approval(
         self,
         review_task_id: str,
         polling_interval: float = 5.0,
         timeout: Optional[float] = None,
+        min_interval: float = 0.25,
+        max_interval: float = 30.0,
+        backoff_factor: float = 2.0,
     ) -> VelatirResponse:
         """
         Wait for a review task to be approved or denied.
 
+        Polls the review task status with exponential backoff: the first check
+        happens after ``min_interval`` seconds so fast approvals are detected
+        quickly, and the interval grows by ``backoff_factor`` (with jitter) up
+        to ``max_interval`` so long waits don't hammer the status endpoint.
+
+        Concurrent waiters on the same review task share a single background
+        polling loop, so status traffic per task stays constant regardless of
+        how many callers are waiting.
+
         Args:
             review_task_id: ID of the review task
-            polling_interval: Seconds between polling attempts
+            polling_interval: Deprecated; retained for backward compatibility.
+                The adaptive backoff schedule replaces fixed-interval polling.
             timeout: Optional timeout in seconds (None for infinite)
+            min_interval: Initial delay between polling attempts
+            max_interval: Maximum delay between polling attempts
+            backoff_factor: Multiplier applied to the delay after each attempt
 
         Returns:
             VelatirResponse with final state
@@ -123,28 +629,116 @@ class VelatirClient:
         Raises:
             VelatirTimeoutError: If timeout is reached before completion
         """
-        start_time = time.time()
-        max_attempts = None
+        # Monotonic clocks keep the timeout immune to wall-clock jumps
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
 
-        if timeout is not None:
-            # Calculate max attempts based on timeout and polling interval
-            max_attempts = int(timeout / polling_interval) + 1
+        fut = self._waiters.get(review_task_id)
+        if fut is None or fut.cancelled():
+            fut = loop.create_future()
+            self._waiters[review_task_id] = fut
+            self._poller_tasks[review_task_id] = asyncio.create_task(
+                self._poll_until_terminal(
+                    review_task_id, fut, min_interval, max_interval, backoff_factor
+                )
+            )
+        self._waiter_counts[review_task_id] = self._waiter_counts.get(review_task_id, 0) + 1
 
         try:
-            response = await self._client.wait_for_approval(
-                review_task_id=review_task_id,
-                polling_interval=polling_interval,
-                max_attempts=max_attempts,
-            )
-            return response
-        except velatir.VelatirTimeoutError as e:
-            # Re-raise as our custom timeout error
-            elapsed = time.time() - start_time
+            # Shield so one waiter timing out doesn't cancel the shared poller
+            return await asyncio.wait_for(asyncio.shield(fut), timeout)
+        except asyncio.TimeoutError:
+            elapsed = loop.time() - start_time
             raise VelatirTimeoutError(
-                f"Approval timeout after {elapsed:.1f}s waiting for review task {review_task_id}",
+                f"Approval timeout after {elapsed:.1f}s waiting for review task "
+                f"{review_task_id}",
                 review_task_id=review_task_id,
                 timeout_seconds=elapsed,
-            ) from e
+            ) from None
+        finally:
+            remaining = self._waiter_counts.get(review_task_id, 1) - 1
+            if remaining > 0:
+                self._waiter_counts[review_task_id] = remaining
+            else:
+                self._waiter_counts.pop(review_task_id, None)
+                if not fut.done():
+                    # Last waiter abandoned a still-pending task: stop the
+                    # orphaned poller instead of long-polling forever, and
+                    # cancel the future so an exception set during teardown
+                    # is never flagged as unretrieved
+                    poller = self._poller_tasks.get(review_task_id)
+                    if poller is not None:
+                        poller.cancel()
+                    fut.cancel()
+
+    async def _poll_until_terminal(
+        self,
+        review_task_id: str,
+        fut: "asyncio.Future[VelatirResponse]",
+        min_interval: float,
+        max_interval: float,
+        backoff_factor: float,
+    ) -> None:
+        """Single background polling loop backing all waiters for one task."""
+        delay = min_interval
+        event = self._completion_events.setdefault(review_task_id, asyncio.Event())
+        try:
+            while True:
+                response = await self.get_review_task_status(review_task_id, wait=_LONG_POLL_MAX)
+                if _is_terminal(response):
+                    if not fut.done():
+                        fut.set_result(response)
+                    return
+                if fut.done():
+                    # Resolved out-of-band via notify_complete
+                    return
+
+                if self._supports_long_poll:
+                    # The server already held the request; just pace retries
+                    interval = min_interval
+                else:
+                    # Jitter the delay to desynchronize pollers across tasks
+                    interval = delay * random.uniform(0.7, 1.3)
+                    delay = min(delay * backoff_factor, max_interval)
+
+                # Sleep on the completion event so notify_complete() unblocks
+                # the loop immediately instead of waiting out the interval
+                try:
+                    await asyncio.wait_for(event.wait(), timeout=interval)
+                except asyncio.TimeoutError:
+                    continue
+                if fut.done():
+                    return
+        except Exception as e:
+            if not fut.done():
+                fut.set_exception(e)
+        finally:
+            # Guard by identity: a replacement poller for the same task may
+            # already have registered its own entries
+            if self._waiters.get(review_task_id) is fut:
+                del self._waiters[review_task_id]
+                self._completion_events.pop(review_task_id, None)
+                self._poller_tasks.pop(review_task_id, None)
+
+    def notify_complete(self, review_task_id: str, response: VelatirResponse) -> None:
+        """Deliver an out-of-band completion for a review task.
+
+        Intended for callers that learn about decisions through a push channel
+        (e.g. a webhook listener): the decision is cached, any waiters are
+        resolved immediately, and a sleeping poller is woken rather than
+        waiting out its current backoff interval.
+
+        Args:
+            review_task_id: ID of the completed review task
+            response: The final VelatirResponse delivered out-of-band
+        """
+        self._status_cache_store(review_task_id, response)
+        fut = self._waiters.get(review_task_id)
+        if fut is not None and not fut.done():
+            fut.set_result(response)
+        event = self._completion_events.get(review_task_id)
+        if event is not None:
+            event.set()
 
     def create_review_task_sync(
         self,
@@ -156,7 +750,20 @@ class VelatirClient:
         parent_review_task_id: Optional[str] = None,
     ) -> VelatirResponse:
         """Synchronous version of create_review_task."""
-        return self._client.create_review_task_sync(
+        key = None
+        if self.dedup_create or self._decisions is not None:
+            key = _dedup_key(function_name, args, doc, parent_review_task_id)
+        if self.dedup_create and key is not None:
+            cached = self._dedup_lookup(key)
+            if cached is not None:
+                return cached
+        if key is not None:
+            decision = self._decision_lookup(key, function_name)
+            if decision is not None:
+                self._status_cache_store(decision.review_task_id, decision)
+                return decision
+
+        response = self._client.create_review_task_sync(
             function_name=function_name,
             args=args,
             doc=doc,
@@ -164,43 +771,117 @@ class VelatirClient:
             metadata=metadata,
             parent_review_task_id=parent_review_task_id,
         )
+        if key is not None:
+            if self.dedup_create:
+                self._dedup_store(key, response)
+            if self._decisions is not None:
+                self._pending_decisions[response.review_task_id] = (key, function_name)
+        return response
 
-    def get_review_task_status_sync(self, review_task_id: str) -> VelatirResponse:
+    def get_review_task_status_sync(
+        self, review_task_id: str, wait: Optional[float] = None
+    ) -> VelatirResponse:
         """Synchronous version of get_review_task_status."""
-        return self._client.get_review_task_status_sync(review_task_id)
+        cached = self._status_cache_lookup(review_task_id)
+        if cached is not None:
+            return cached
+        if wait is not None and self._supports_long_poll is not False:
+            try:
+                response = self._client.get_review_task_status_sync(review_task_id, wait=wait)
+                self._supports_long_poll = True
+            except TypeError:
+                self._supports_long_poll = False
+                response = self._client.get_review_task_status_sync(review_task_id)
+        else:
+            response = self._client.get_review_task_status_sync(review_task_id)
+        self._status_cache_store(review_task_id, response)
+        return response
 
     def wait_for_approval_sync(
         self,
         review_task_id: str,
         polling_interval: float = 5.0,
         timeout: Optional[float] = None,
+        min_interval: float = 0.25,
+        max_interval: float = 30.0,
+        backoff_factor: float = 2.0,
     ) -> VelatirResponse:
-        """Synchronous version of wait_for_approval."""
-        start_time = time.time()
-        max_attempts = None
+        """Synchronous version of wait_for_approval.
 
-        if timeout is not None:
-            max_attempts = int(timeout / polling_interval) + 1
+        Where the SDK supports a long-poll ``wait`` hint, the server holds each
+        status request until the state changes, replacing most of the local
+        sleeping; otherwise the loop falls back to jittered exponential backoff.
+        """
+        # time.monotonic keeps the timeout immune to wall-clock jumps
+        start_time = time.monotonic()
+        delay = min_interval
 
-        try:
-            response = self._client.wait_for_approval_sync(
-                review_task_id=review_task_id,
-                polling_interval=polling_interval,
-                max_attempts=max_attempts,
-            )
-            return response
-        except velatir.VelatirTimeoutError as e:
-            elapsed = time.time() - start_time
-            raise VelatirTimeoutError(
-                f"Approval timeout after {elapsed:.1f}s waiting for review task {review_task_id}",
-                review_task_id=review_task_id,
-                timeout_seconds=elapsed,
-            ) from e
+        while True:
+            elapsed = time.monotonic() - start_time
+            remaining = None if timeout is None else timeout - elapsed
+            if remaining is None:
+                wait_hint = _LONG_POLL_MAX
+            else:
+                wait_hint = max(min(remaining, _LONG_POLL_MAX), 0.0)
+
+            response = self.get_review_task_status_sync(review_task_id, wait=wait_hint)
+            if _is_terminal(response):
+                return response
+
+            elapsed = time.monotonic() - start_time
+            if timeout is not None and elapsed >= timeout:
+                raise VelatirTimeoutError(
+                    f"Approval timeout after {elapsed:.1f}s waiting for review task "
+                    f"{review_task_id}",
+                    review_task_id=review_task_id,
+                    timeout_seconds=elapsed,
+                )
+
+            if self._supports_long_poll:
+                # The server already held the request; just pace retries
+                time.sleep(min_interval)
+                continue
+
+            sleep_for = delay * random.uniform(0.7, 1.3)
+            if timeout is not None:
+                sleep_for = min(sleep_for, timeout - elapsed)
+            time.sleep(sleep_for)
+            delay = min(delay * backoff_factor, max_interval)
 
     async def close(self) -> None:
-        """Close the underlying HTTP client."""
+        """Release this wrapper's reference to the pooled SDK client.
+
+        The underlying HTTP client is only closed when the last wrapper
+        sharing it releases its reference. Calling close() more than once
+        is a no-op.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._decisions is not None:
+            self._decisions.close()
+            self._decisions = None
+        with _SDK_POOL_LOCK:
+            remaining = _SDK_CLIENT_REFCOUNTS.get(self._pool_key, 1) - 1
+            if remaining > 0:
+                _SDK_CLIENT_REFCOUNTS[self._pool_key] = remaining
+                return
+            _SDK_CLIENT_REFCOUNTS.pop(self._pool_key, None)
+            _SDK_CLIENT_POOL.pop(self._pool_key, None)
         await self._client.close()
 
+    def __del__(self) -> None:
+        """Release the pooled reference if the wrapper is garbage-collected open."""
+        if getattr(self, "_closed", True):
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(self.close())
+        _CLOSE_TASKS.add(task)
+        task.add_done_callback(_CLOSE_TASKS.discard)
+
     async def __aenter__(self) -> "VelatirClient":
         """Async context manager entry."""
         return self
@@ -238,7 +919,15 @@ class VelatirClient:
         Returns:
             TraceResponse with trace_id, status, processed_async, and optional review_task_id
         """
-        return await self._client.create_trace(
+        key = None
+        if self._decisions is not None:
+            key = _dedup_key(function_name, args, doc, None)
+            decision = self._decision_lookup(key, function_name)
+            if decision is not None:
+                self._status_cache_store(decision.review_task_id, decision)
+                return decision
+
+        response = await self._client.create_trace(
             function_name=function_name,
             args=args,
             tool_calls=tool_calls,
@@ -246,6 +935,18 @@ class VelatirClient:
             llm_explanation=llm_explanation,
             metadata=metadata,
         )
+        self._trace_decision_track(key, function_name, response)
+        return response
+
+    def _trace_decision_track(
+        self, key: Optional[str], function_name: str, response: TraceResponse
+    ) -> None:
+        """Register a trace's review task so its decision lands in the store."""
+        if key is None:
+            return
+        review_task_id = getattr(response, "review_task_id", None)
+        if review_task_id is not None:
+            self._pending_decisions[review_task_id] = (key, function_name)
 
     def create_trace_sync(
         self,
@@ -257,7 +958,15 @@ class VelatirClient:
         metadata: Optional[dict[str, Any]] = None,
     ) -> TraceResponse:
         """Synchronous version of create_trace."""
-        return self._client.create_trace_sync(
+        key = None
+        if self._decisions is not None:
+            key = _dedup_key(function_name, args, doc, None)
+            decision = self._decision_lookup(key, function_name)
+            if decision is not None:
+                self._status_cache_store(decision.review_task_id, decision)
+                return decision
+
+        response = self._client.create_trace_sync(
             function_name=function_name,
             args=args,
             tool_calls=tool_calls,
@@ -265,6 +974,8 @@ class VelatirClient:
             llm_explanation=llm_explanation,
             metadata=metadata,
         )
+        self._trace_decision_track(key, function_name, response)
+        return response
 
     async def evaluate_and_wait(
         self,
@@ -276,13 +987,17 @@ class VelatirClient:
         metadata: Optional[dict[str, Any]] = None,
         polling_interval: float = 5.0,
         timeout: Optional[float] = None,
+        min_interval: float = 0.25,
+        max_interval: float = 30.0,
+        backoff_factor: float = 2.0,
     ) -> TraceResponse | VelatirResponse:
         """
         Create a trace and wait for approval if human review is required.
 
-        This is a convenience method that combines create_trace and wait_for_trace_approval.
-        It creates a trace, and if human review is required (reviewTaskId present),
-        automatically polls until a final decision is made.
+        This is a convenience method that combines create_trace and
+        wait_for_approval. It creates a trace, and if human review is required
+        (review_task_id present), polls with adaptive backoff until a final
+        decision is made.
 
         Args:
             function_name: Name of the function/operation being traced
@@ -291,35 +1006,36 @@ class VelatirClient:
             doc: Optional documentation/description
             llm_explanation: Optional LLM-generated explanation
             metadata: Optional additional metadata
-            polling_interval: Seconds between polling attempts
+            polling_interval: Deprecated; retained for backward compatibility
             timeout: Optional timeout in seconds
+            min_interval: Initial delay between polling attempts
+            max_interval: Maximum delay between polling attempts
+            backoff_factor: Multiplier applied to the delay after each attempt
 
         Returns:
             TraceResponse if no human review needed, VelatirResponse with final decision otherwise
         """
-        start_time = time.time()
-        max_attempts = None
-
-        if timeout is not None:
-            max_attempts = int(timeout / polling_interval) + 1
-
-        try:
-            return await self._client.evaluate_and_wait(
-                function_name=function_name,
-                args=args,
-                tool_calls=tool_calls,
-                doc=doc,
-                llm_explanation=llm_explanation,
-                metadata=metadata,
-                polling_interval=polling_interval,
-                max_attempts=max_attempts,
-            )
-        except velatir.VelatirTimeoutError as e:
-            elapsed = time.time() - start_time
-            raise VelatirTimeoutError(
-                f"Approval timeout after {elapsed:.1f}s",
-                timeout_seconds=elapsed,
-            ) from e
+        trace = await self.create_trace(
+            function_name=function_name,
+            args=args,
+            tool_calls=tool_calls,
+            doc=doc,
+            llm_explanation=llm_explanation,
+            metadata=metadata,
+        )
+        review_task_id = getattr(trace, "review_task_id", None)
+        if review_task_id is None or _is_terminal(trace):
+            # No human review needed, or the decision was replayed from the
+            # local store — nothing to wait for
+            return trace
+        return await self.wait_for_approval(
+            review_task_id,
+            polling_interval=polling_interval,
+            timeout=timeout,
+            min_interval=min_interval,
+            max_interval=max_interval,
+            backoff_factor=backoff_factor,
+        )
 
     def evaluate_and_wait_sync(
         self,
@@ -331,28 +1047,27 @@ class VelatirClient:
         metadata: Optional[dict[str, Any]] = None,
         polling_interval: float = 5.0,
         timeout: Optional[float] = None,
+        min_interval: float = 0.25,
+        max_interval: float = 30.0,
+        backoff_factor: float = 2.0,
     ) -> TraceResponse | VelatirResponse:
         """Synchronous version of evaluate_and_wait."""
-        start_time = time.time()
-        max_attempts = None
-
-        if timeout is not None:
-            max_attempts = int(timeout / polling_interval) + 1
-
-        try:
-            return self._client.evaluate_and_wait_sync(
-                function_name=function_name,
-                args=args,
-                tool_calls=tool_calls,
-                doc=doc,
-                llm_explanation=llm_explanation,
-                metadata=metadata,
-                polling_interval=polling_interval,
-                max_attempts=max_attempts,
-            )
-        except velatir.VelatirTimeoutError as e:
-            elapsed = time.time() - start_time
-            raise VelatirTimeoutError(
-                f"Approval timeout after {elapsed:.1f}s",
-                timeout_seconds=elapsed,
-            ) from e
+        trace = self.create_trace_sync(
+            function_name=function_name,
+            args=args,
+            tool_calls=tool_calls,
+            doc=doc,
+            llm_explanation=llm_explanation,
+            metadata=metadata,
+        )
+        review_task_id = getattr(trace, "review_task_id", None)
+        if review_task_id is None or _is_terminal(trace):
+            return trace
+        return self.wait_for_approval_sync(
+            review_task_id,
+            polling_interval=polling_interval,
+            timeout=timeout,
+            min_interval=min_interval,
+            max_interval=max_interval,
+            backoff_factor=backoff_factor,
+        )
@@ -6,12 +6,14 @@ from typing import Optional
 class VelatirMiddlewareError(Exception):
     """Base exception for Velatir middleware errors."""
 
-    pass
+    __slots__ = ()
 
 
 class VelatirPolicyViolationError(VelatirMiddlewareError):
     """Raised when a policy violation is detected by Velatir guardrails."""
 
+    __slots__ = ("review_task_id", "violated_policies", "requested_change")
+
     def __init__(
         self,
         message: str,
@@ -28,6 +30,8 @@ class VelatirPolicyViolationError(VelatirMiddlewareError):
 class VelatirApprovalDeniedError(VelatirMiddlewareError):
     """Raised when a human approval request is denied."""
 
+    __slots__ = ("review_task_id", "requested_change")
+
     def __init__(
         self,
         message: str,
@@ -42,6 +46,8 @@ class VelatirApprovalDeniedError(VelatirMiddlewareError):
 class VelatirTimeoutError(VelatirMiddlewareError):
     """Raised when waiting for approval times out."""
 
+    __slots__ = ("review_task_id", "timeout_seconds")
+
     def __init__(
         self,
         message: str,
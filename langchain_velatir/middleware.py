@@ -1,55 +1,111 @@
 """LangChain middleware implementations for Velatir integration."""
 
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
 from typing import Any, Optional
 
 from langchain_core.messages import AIMessage
 
-from langchain_velatir.client import VelatirClient
+from langchain_velatir._compat import AgentMiddleware, Runtime, hook_config
+from langchain_velatir.client import VelatirClient, _load_sdk
 from langchain_velatir.exceptions import (
     VelatirApprovalDeniedError,
+    VelatirMiddlewareError,
     VelatirTimeoutError,
 )
-from langchain_velatir.types import GuardrailMode
+from langchain_velatir.types import GuardrailMode, ReviewDecision
+
+try:
+    import httpx
+
+    _TRANSPORT_ERRORS: tuple[type[Exception], ...] = (httpx.HTTPError,)
+except ImportError:
+    _TRANSPORT_ERRORS = ()
+
+# Exception classes the Velatir SDK raises for API, rate-limit, and server
+# failures, probed from the lazily loaded module the same way httpx is. The
+# SDK loads here anyway the moment a middleware constructs its client.
+_SDK_ERRORS: tuple[type[Exception], ...] = tuple(
+    obj
+    for obj in vars(_load_sdk()[0]).values()
+    if isinstance(obj, type) and issubclass(obj, Exception)
+)
+
+# Failures of the review round-trip that should fail closed (or be logged)
+# rather than propagate; programming errors are deliberately excluded so
+# they surface with their real tracebacks
+_REVIEW_ERRORS: tuple[type[Exception], ...] = (
+    (
+        VelatirMiddlewareError,
+        ConnectionError,
+        TimeoutError,
+        OSError,
+    )
+    + _TRANSPORT_ERRORS
+    + _SDK_ERRORS
+)
 
 # Type alias for agent state (used as a dictionary)
 AgentState = dict[str, Any]
 
+# String-to-enum coercion table for the guardrail mode argument
+_MODE_LOOKUP = {mode.value: mode for mode in GuardrailMode}
 
-# Import AgentMiddleware and hook_config from langchain
-try:
-    from langchain.agents.middleware import AgentMiddleware, hook_config
-except ImportError:
-    # Fallback for older LangChain versions
-    try:
-        from langchain.agents import AgentMiddleware, hook_config
-    except ImportError:
-        try:
-            from langchain_core.agents import AgentMiddleware, hook_config
-        except ImportError:
-            # Define placeholder for type hints if not available
-            class AgentMiddleware:  # type: ignore
-                """Placeholder for AgentMiddleware base class."""
 
-                pass
+def _compact_messages(messages: list[Any]) -> list[dict[str, Any]]:
+    """Reduce LangChain messages to role/content dicts for review payloads.
 
-            def hook_config(**kwargs):  # type: ignore
-                """Placeholder for hook_config decorator."""
+    The full message repr re-serializes tool_calls and additional_kwargs and
+    is several times larger than the content itself; reviewers only need the
+    role and text.
+    """
+    return [
+        {"role": getattr(m, "type", type(m).__name__), "content": getattr(m, "content", "")}
+        for m in messages
+    ]
 
-                def decorator(func):
-                    return func
 
-                return decorator
+def _approval_cache_key(function_name: str, args: dict[str, Any]) -> str:
+    """Build an exact-match cache key from the function name and args content."""
+    digest = hashlib.blake2b(
+        json.dumps(args, sort_keys=True, default=str).encode(), digest_size=16
+    ).hexdigest()
+    return f"{function_name}:{digest}"
 
 
-# Import Runtime type
-try:
-    from langgraph.runtime import Runtime
-except ImportError:
-    # Fallback placeholder if not available
-    class Runtime:  # type: ignore
-        """Placeholder for Runtime type if not available in imports."""
+class _ApprovalCache:
+    """Bounded TTL cache of approved review decisions.
+
+    Only exact-match, approved decisions are cached; anything denied, pending
+    or requiring intervention always goes back to Velatir.
+    """
+
+    __slots__ = ("_ttl", "_maxsize", "_entries")
+
+    def __init__(self, ttl: float, maxsize: int):
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
 
-        pass
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, response = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return response
+
+    def put(self, key: str, response: Any) -> None:
+        self._entries[key] = (time.monotonic() + self._ttl, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
 
 
 class VelatirGuardrailMiddleware(AgentMiddleware):
@@ -88,8 +144,13 @@ class VelatirGuardrailMiddleware(AgentMiddleware):
         timeout: float = 10.0,
         approval_timeout: float = 30.0,
         polling_interval: float = 2.0,
+        min_poll_interval: float = 0.25,
+        max_poll_interval: float = 30.0,
+        backoff_factor: float = 2.0,
         blocked_message: str = "This response requires review and was not approved.",
         metadata: Optional[dict[str, Any]] = None,
+        cache_ttl: float = 0.0,
+        cache_max: int = 1024,
     ):
         """
         Initialize the Velatir guardrail middleware.
@@ -100,9 +161,23 @@ class VelatirGuardrailMiddleware(AgentMiddleware):
             base_url: Optional custom Velatir API URL
             timeout: Request timeout in seconds
             approval_timeout: Max seconds to wait for Velatir decision
-            polling_interval: Seconds between polling for decision
+            polling_interval: Deprecated; retained for backward compatibility.
+                Polling now starts quick and slows down adaptively.
+            min_poll_interval: Initial delay between decision polls. The
+                default (0.25s) detects instant policy approvals sub-second;
+                raise it if your reviews always involve a human.
+            max_poll_interval: Ceiling for the adaptive poll delay. Lower it
+                for snappier detection on long waits at the cost of more
+                status requests.
+            backoff_factor: Multiplier applied to the poll delay after each
+                attempt
             blocked_message: Message to return when a response is blocked
             metadata: Optional metadata to include with all review tasks
+            cache_ttl: Seconds to reuse approved decisions for byte-identical
+                review payloads without calling Velatir. 0 (the default)
+                disables the cache and preserves current semantics. Only
+                exact-match approvals are cached.
+            cache_max: Maximum number of cached approvals (LRU eviction)
         """
         super().__init__()
         self.velatir_client = VelatirClient(
@@ -111,11 +186,127 @@ class VelatirGuardrailMiddleware(AgentMiddleware):
             timeout=timeout,
         )
 
-        self.mode = GuardrailMode(mode) if isinstance(mode, str) else mode
+        if isinstance(mode, str):
+            try:
+                mode = _MODE_LOOKUP[mode]
+            except KeyError:
+                raise ValueError(f"{mode!r} is not a valid GuardrailMode") from None
+        self.mode = mode
+        # Resolved once; every decision branch checks this instead of
+        # re-comparing the enum
+        self._blocking: bool = self.mode is GuardrailMode.BLOCKING
         self.approval_timeout = approval_timeout
         self.polling_interval = polling_interval
+        self.min_poll_interval = min_poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.backoff_factor = backoff_factor
         self.blocked_message = blocked_message
+        # Validated AIMessage templates keyed by content; blocked responses
+        # are minted with model_copy, skipping pydantic validation each time
+        self._blocked_templates: dict[str, AIMessage] = {}
         self.metadata = metadata or {}
+        # Static for the middleware's lifetime; built once and reused per call
+        self._base_metadata = {
+            **self.metadata,
+            "middleware": "VelatirGuardrailMiddleware",
+            "mode": self.mode.value,
+        }
+        self._approval_cache = _ApprovalCache(cache_ttl, cache_max) if cache_ttl > 0 else None
+
+    def _review_args(self, messages: list[Any], content: Any) -> dict[str, Any]:
+        """Build the args payload sent to Velatir for a response review."""
+        return {
+            "response": content,
+            "conversation_context": _compact_messages(messages[-3:]),  # Last 3 messages
+        }
+
+    def _cache_approval(self, cache_key: Optional[str], response: ReviewDecision) -> None:
+        """Record an approved decision for reuse within the cache TTL."""
+        if (
+            cache_key is not None
+            and self._approval_cache is not None
+            and response.is_approved
+            and not getattr(response, "requires_intervention", False)
+        ):
+            self._approval_cache.put(cache_key, response)
+
+    def _task_metadata(self) -> dict[str, Any]:
+        """Return the provided metadata combined with the middleware identifier."""
+        return self._base_metadata
+
+    def _blocked_state(self, messages: list[Any], content: str, **info: Any) -> dict[str, Any]:
+        """Build a state update replacing the last message with a blocked response.
+
+        The slice-copy of messages happens exactly once here; every blocking
+        branch (denied, timeout, error) funnels through this helper. The
+        handful of constant message contents are validated once and reused as
+        templates, so repeat blocks only pay for a model_copy.
+        """
+        template = self._blocked_templates.get(content)
+        if template is None:
+            template = self._blocked_templates[content] = AIMessage(content=content)
+        new_messages = messages[:-1]
+        new_messages.append(
+            template.model_copy(update={"additional_kwargs": {"velatir_blocked": True, **info}})
+        )
+        return {"messages": new_messages}
+
+    def _apply_decision(
+        self, messages: list[Any], last_message: AIMessage, response: ReviewDecision
+    ) -> dict[str, Any] | None:
+        """Translate a Velatir decision into a state update (or None to continue)."""
+        # Check the response - could be TraceResponse or VelatirResponse
+        if response.is_approved:
+            # Approved (either immediately or after human review)
+            return None
+
+        elif (
+            response.is_rejected
+            or getattr(response, "is_denied", False)
+            or getattr(response, "is_change_requested", False)
+        ):
+            # Rejected by policy or human reviewer
+            if self._blocking:
+                # Block the response
+                return self._blocked_state(
+                    messages,
+                    self.blocked_message,
+                    trace_id=getattr(response, "trace_id", None),
+                    review_task_id=getattr(response, "review_task_id", None),
+                    reason=getattr(response, "requested_change", None),
+                )
+            else:
+                # Logging mode: add warning but don't block
+                if hasattr(last_message, "additional_kwargs"):
+                    last_message.additional_kwargs["velatir_warning"] = {
+                        "trace_id": getattr(response, "trace_id", None),
+                        "review_task_id": getattr(response, "review_task_id", None),
+                        "reason": getattr(response, "requested_change", None),
+                    }
+                return None
+
+        # For any other status, allow through
+        return None
+
+    def _on_timeout(self, messages: list[Any]) -> dict[str, Any] | None:
+        """Handle a review timing out; blocking mode replaces the response."""
+        if self._blocking:
+            return self._blocked_state(
+                messages,
+                "Response review timed out.",
+                reason="Timeout waiting for approval",
+            )
+        return None
+
+    def _on_error(self, messages: list[Any], error: Exception) -> dict[str, Any] | None:
+        """Handle a review system error; blocking mode fails closed."""
+        if self._blocking:
+            return self._blocked_state(
+                messages,
+                "Response blocked due to review system error.",
+                error=str(error),
+            )
+        return None
 
     @hook_config(can_jump_to=["end"])
     def after_agent(self, state: AgentState, runtime: Runtime) -> dict[str, Any] | None:
@@ -126,6 +317,9 @@ class VelatirGuardrailMiddleware(AgentMiddleware):
         evaluates the response against your configured policies and flows, determines
         risk level, and decides if human intervention is needed.
 
+        This sync variant blocks the calling thread for the whole review
+        round-trip; prefer the async hook (aafter_agent) on async runtimes.
+
         Args:
             state: Current agent state with messages
             runtime: Agent runtime context
@@ -133,8 +327,9 @@ class VelatirGuardrailMiddleware(AgentMiddleware):
         Returns:
             Modified state to block the response, or None to continue
         """
-        # Get the last message from the agent
-        messages = state.get("messages", [])
+        # Get the last message from the agent; skip the default-list
+        # allocation on the empty-state fast path
+        messages = state.get("messages")
         if not messages:
             return None
 
@@ -144,109 +339,96 @@ class VelatirGuardrailMiddleware(AgentMiddleware):
         if not isinstance(last_message, AIMessage):
             return None
 
-        # Extract message content for review
-        content = last_message.content if hasattr(last_message, "content") else str(last_message)
+        # isinstance above guarantees .content exists; access it directly
+        content = last_message.content
+
+        args = self._review_args(messages, content)
+        cache_key = None
+        if self._approval_cache is not None:
+            cache_key = _approval_cache_key("agent_response", args)
+            if self._approval_cache.get(cache_key) is not None:
+                # A byte-identical payload was approved within the TTL
+                return None
 
         # Create a trace in Velatir for guardrail evaluation
         # Velatir's backend will determine which policies apply, risk level, and routing
         try:
-            # Combine provided metadata with middleware identifier
-            task_metadata = {
-                **self.metadata,
-                "middleware": "VelatirGuardrailMiddleware",
-                "mode": self.mode.value,
-            }
-
             # Use the new traces endpoint with automatic polling
             response = self.velatir_client.evaluate_and_wait_sync(
                 function_name="agent_response",
-                args={
-                    "response": content,
-                    "conversation_context": [str(m) for m in messages[-3:]],  # Last 3 messages
-                },
+                args=args,
                 doc="LangChain agent response requiring governance review",
-                metadata=task_metadata,
+                metadata=self._task_metadata(),
                 polling_interval=self.polling_interval,
                 timeout=self.approval_timeout,
+                min_interval=self.min_poll_interval,
+                max_interval=self.max_poll_interval,
+                backoff_factor=self.backoff_factor,
             )
+        except VelatirTimeoutError:
+            # Timeout waiting for approval
+            return self._on_timeout(messages)
+        except _REVIEW_ERRORS as e:
+            # On a review-system error, behavior depends on mode;
+            # anything else is a bug and propagates untouched
+            return self._on_error(messages, e)
 
-            # Check the response - could be TraceResponse or VelatirResponse
-            if response.is_approved:
-                # Approved (either immediately or after human review)
-                return None
+        self._cache_approval(cache_key, response)
+        return self._apply_decision(messages, last_message, response)
 
-            elif (
-                response.is_rejected
-                or getattr(response, "is_denied", False)
-                or getattr(response, "is_change_requested", False)
-            ):
-                # Rejected by policy or human reviewer
-                if self.mode == GuardrailMode.BLOCKING:
-                    # Block the response
-                    trace_id = getattr(response, "trace_id", None)
-                    review_task_id = getattr(response, "review_task_id", None)
-                    reason = getattr(response, "requested_change", None)
-                    return {
-                        "messages": messages[:-1]
-                        + [
-                            AIMessage(
-                                content=self.blocked_message,
-                                additional_kwargs={
-                                    "velatir_blocked": True,
-                                    "trace_id": trace_id,
-                                    "review_task_id": review_task_id,
-                                    "reason": reason,
-                                },
-                            )
-                        ]
-                    }
-                else:
-                    # Logging mode: add warning but don't block
-                    if hasattr(last_message, "additional_kwargs"):
-                        last_message.additional_kwargs["velatir_warning"] = {
-                            "trace_id": getattr(response, "trace_id", None),
-                            "review_task_id": getattr(response, "review_task_id", None),
-                            "reason": getattr(response, "requested_change", None),
-                        }
-                    return None
-
-            # For any other status, allow through
-            return None
+    @hook_config(can_jump_to=["end"])
+    async def aafter_agent(self, state: AgentState, runtime: Runtime) -> dict[str, Any] | None:
+        """
+        Async variant of after_agent.
 
-        except VelatirTimeoutError:
-            # Timeout waiting for approval
-            if self.mode == GuardrailMode.BLOCKING:
-                return {
-                    "messages": messages[:-1]
-                    + [
-                        AIMessage(
-                            content="Response review timed out.",
-                            additional_kwargs={
-                                "velatir_blocked": True,
-                                "reason": "Timeout waiting for approval",
-                            },
-                        )
-                    ]
-                }
+        Awaits the Velatir review instead of blocking the event loop, so the
+        runtime can interleave other work during the approval round-trip.
+
+        Args:
+            state: Current agent state with messages
+            runtime: Agent runtime context
+
+        Returns:
+            Modified state to block the response, or None to continue
+        """
+        messages = state.get("messages")
+        if not messages:
             return None
 
-        except Exception as e:
-            # On error, behavior depends on mode
-            if self.mode == GuardrailMode.BLOCKING:
-                return {
-                    "messages": messages[:-1]
-                    + [
-                        AIMessage(
-                            content="Response blocked due to review system error.",
-                            additional_kwargs={
-                                "velatir_blocked": True,
-                                "error": str(e),
-                            },
-                        )
-                    ]
-                }
+        last_message = messages[-1]
+        if not isinstance(last_message, AIMessage):
             return None
 
+        content = last_message.content
+
+        args = self._review_args(messages, content)
+        cache_key = None
+        if self._approval_cache is not None:
+            cache_key = _approval_cache_key("agent_response", args)
+            if self._approval_cache.get(cache_key) is not None:
+                # A byte-identical payload was approved within the TTL
+                return None
+
+        try:
+            response = await self.velatir_client.evaluate_and_wait(
+                function_name="agent_response",
+                args=args,
+                doc="LangChain agent response requiring governance review",
+                metadata=self._task_metadata(),
+                polling_interval=self.polling_interval,
+                timeout=self.approval_timeout,
+                min_interval=self.min_poll_interval,
+                max_interval=self.max_poll_interval,
+                backoff_factor=self.backoff_factor,
+            )
+        except VelatirTimeoutError:
+            return self._on_timeout(messages)
+        except _REVIEW_ERRORS as e:
+            return self._on_error(messages, e)
+
+        self._cache_approval(cache_key, response)
+        return self._apply_decision(messages, last_message, response)
+
 
 class VelatirHITLMiddleware(AgentMiddleware):
     """
@@ -289,8 +471,13 @@ class VelatirHITLMiddleware(AgentMiddleware):
         base_url: Optional[str] = None,
         polling_interval: float = 5.0,
         timeout: float = 600.0,
+        min_poll_interval: float = 0.25,
+        max_poll_interval: float = 30.0,
+        backoff_factor: float = 2.0,
         require_approval_for: Optional[list[str]] = None,
         metadata: Optional[dict[str, Any]] = None,
+        cache_ttl: float = 0.0,
+        cache_max: int = 1024,
     ):
         """
         Initialize the Velatir HITL middleware.
@@ -298,11 +485,25 @@ class VelatirHITLMiddleware(AgentMiddleware):
         Args:
             api_key: Velatir API key
             base_url: Optional custom Velatir API URL
-            polling_interval: Seconds between polling for approval
+            polling_interval: Deprecated; retained for backward compatibility.
+                Polling now starts quick and slows down adaptively.
             timeout: Maximum seconds to wait for approval
+            min_poll_interval: Initial delay between approval polls. The
+                default (0.25s) detects instant approvals sub-second; raise it
+                if your reviews always involve a human.
+            max_poll_interval: Ceiling for the adaptive poll delay. Lower it
+                for snappier detection on long waits at the cost of more
+                status requests.
+            backoff_factor: Multiplier applied to the poll delay after each
+                attempt
             require_approval_for: Optional list of tool names to send through Velatir.
                                  If None, all tools are sent to Velatir for evaluation.
             metadata: Optional metadata to include with all review tasks
+            cache_ttl: Seconds to reuse approved decisions for byte-identical
+                tool calls without calling Velatir. 0 (the default) disables
+                the cache and preserves current semantics. Only exact-match
+                approvals are cached.
+            cache_max: Maximum number of cached approvals (LRU eviction)
         """
         super().__init__()
         self.velatir_client = VelatirClient(
@@ -311,8 +512,94 @@ class VelatirHITLMiddleware(AgentMiddleware):
         )
         self.polling_interval = polling_interval
         self.timeout = timeout
+        self.min_poll_interval = min_poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.backoff_factor = backoff_factor
         self.require_approval_for = require_approval_for
+        # Frozen copy for constant-time membership tests on the per-tool path
+        self._approval_filter = (
+            frozenset(require_approval_for) if require_approval_for is not None else None
+        )
         self.metadata = metadata or {}
+        # Static for the middleware's lifetime; built once and reused per call
+        self._base_metadata = {**self.metadata, "middleware": "VelatirHITLMiddleware"}
+        self._approval_cache = _ApprovalCache(cache_ttl, cache_max) if cache_ttl > 0 else None
+
+    _NO_TOOL_CALLS: tuple[list[Any], list[dict[str, Any]]] = ([], [])
+
+    def _pending_tool_calls(self, state: AgentState) -> tuple[list[Any], list[dict[str, Any]]]:
+        """Extract the tool calls that need Velatir evaluation from the state."""
+        messages = state.get("messages")
+        if not messages:
+            return self._NO_TOOL_CALLS
+
+        last_message = messages[-1]
+
+        # Only AIMessages carry tool calls; the isinstance gate lets us read
+        # .tool_calls directly instead of probing with getattr
+        if not isinstance(last_message, AIMessage):
+            return self._NO_TOOL_CALLS
+
+        tool_calls = last_message.tool_calls
+        if not tool_calls:
+            return self._NO_TOOL_CALLS
+
+        # Filter tool calls based on require_approval_for setting
+        if self._approval_filter is not None:
+            tool_calls = [tc for tc in tool_calls if tc.get("name") in self._approval_filter]
+
+        return messages, tool_calls
+
+    def _tool_metadata(
+        self, tool_call: dict[str, Any], context: list[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Combine the static metadata with per-tool-call info."""
+        return {
+            **self._base_metadata,
+            "tool_call_id": tool_call.get("id", "unknown_id"),
+            "conversation_context": context,
+        }
+
+    def _cache_approval(self, cache_key: Optional[str], response: ReviewDecision) -> None:
+        """Record an approved decision for reuse within the cache TTL."""
+        if (
+            cache_key is not None
+            and self._approval_cache is not None
+            and response.is_approved
+            and not getattr(response, "requires_intervention", False)
+        ):
+            self._approval_cache.put(cache_key, response)
+
+    def _check_decision(self, tool_name: str, response: ReviewDecision) -> None:
+        """Raise VelatirApprovalDeniedError if the decision rejects the tool call."""
+        # Check response - could be TraceResponse or VelatirResponse
+        if response.is_approved:
+            # Approved (either immediately or after human review)
+            return
+
+        if (
+            response.is_rejected
+            or getattr(response, "is_denied", False)
+            or getattr(response, "is_change_requested", False)
+        ):
+            # Rejected by policy or human reviewer
+            review_task_id = getattr(response, "review_task_id", None)
+            reason = getattr(response, "requested_change", None)
+            raise VelatirApprovalDeniedError(
+                f"Tool execution denied for {tool_name}: {reason or 'No reason provided'}",
+                review_task_id=review_task_id,
+                requested_change=reason,
+            )
+
+        # For any other status, treat as approved
+
+    def _timeout_error(self, tool_name: str, error: VelatirTimeoutError) -> VelatirTimeoutError:
+        """Wrap a timeout from the wait loop with the tool call context."""
+        return VelatirTimeoutError(
+            f"Timeout waiting for approval of tool {tool_name} after {self.timeout}s",
+            review_task_id=getattr(error, "review_task_id", None),
+            timeout_seconds=self.timeout,
+        )
 
     @hook_config(can_jump_to=["end"])
     def after_model(self, state: AgentState, runtime: Runtime) -> dict[str, Any] | None:
@@ -324,6 +611,9 @@ class VelatirHITLMiddleware(AgentMiddleware):
         configured flows and policies. Low-risk tools may be approved instantly,
         while sensitive operations are routed to human reviewers.
 
+        This sync variant blocks the calling thread for the whole approval
+        round-trip; prefer the async hook (aafter_model) on async runtimes.
+
         Args:
             state: Current agent state
             runtime: Agent runtime context
@@ -331,80 +621,117 @@ class VelatirHITLMiddleware(AgentMiddleware):
         Returns:
             Modified state or None
         """
-        # Extract tool calls if any
-        messages = state.get("messages", [])
-        if not messages:
-            return None
-
-        last_message = messages[-1]
-
-        # Check if there are tool calls to evaluate
-        tool_calls = getattr(last_message, "tool_calls", None)
+        messages, tool_calls = self._pending_tool_calls(state)
         if not tool_calls:
             return None
 
-        # Filter tool calls based on require_approval_for setting
-        if self.require_approval_for is not None:
-            tool_calls = [tc for tc in tool_calls if tc.get("name") in self.require_approval_for]
+        # Built once; the context is identical for every tool call
+        context = _compact_messages(messages[-3:])  # Last 3 messages
 
-        if not tool_calls:
-            return None
+        # Hoist per-iteration attribute lookups out of the loop
+        approval_cache = self._approval_cache
+        evaluate_sync = self.velatir_client.evaluate_and_wait_sync
 
         # Send each tool call to Velatir for evaluation
         for tool_call in tool_calls:
             tool_name = tool_call.get("name", "unknown_tool")
             tool_args = tool_call.get("args", {})
-            tool_id = tool_call.get("id", "unknown_id")
 
-            try:
-                # Combine provided metadata with tool call info
-                task_metadata = {
-                    **self.metadata,
-                    "tool_call_id": tool_id,
-                    "middleware": "VelatirHITLMiddleware",
-                    "conversation_context": [str(m) for m in messages[-3:]],  # Last 3 messages
-                }
+            cache_key = None
+            if approval_cache is not None:
+                cache_key = _approval_cache_key(tool_name, tool_args)
+                if approval_cache.get(cache_key) is not None:
+                    # A byte-identical tool call was approved within the TTL
+                    continue
 
+            try:
                 # Use the new traces endpoint with automatic polling
-                response = self.velatir_client.evaluate_and_wait_sync(
+                response = evaluate_sync(
                     function_name=tool_name,
                     args=tool_args,
                     doc=f"LangChain agent requesting to execute: {tool_name}",
                     llm_explanation="Tool call from LangChain agent workflow",
-                    metadata=task_metadata,
+                    metadata=self._tool_metadata(tool_call, context),
                     polling_interval=self.polling_interval,
                     timeout=self.timeout,
+                    min_interval=self.min_poll_interval,
+                    max_interval=self.max_poll_interval,
+                    backoff_factor=self.backoff_factor,
                 )
+            except VelatirTimeoutError as e:
+                # Timeout waiting for decision
+                raise self._timeout_error(tool_name, e) from e
 
-                # Check response - could be TraceResponse or VelatirResponse
-                if response.is_approved:
-                    # Approved (either immediately or after human review)
-                    continue
+            self._check_decision(tool_name, response)
+            self._cache_approval(cache_key, response)
 
-                elif (
-                    response.is_rejected
-                    or getattr(response, "is_denied", False)
-                    or getattr(response, "is_change_requested", False)
-                ):
-                    # Rejected by policy or human reviewer
-                    review_task_id = getattr(response, "review_task_id", None)
-                    reason = getattr(response, "requested_change", None)
-                    raise VelatirApprovalDeniedError(
-                        f"Tool execution denied for {tool_name}: {reason or 'No reason provided'}",
-                        review_task_id=review_task_id,
-                        requested_change=reason,
-                    )
-
-                # For any other status, continue (treat as approved)
-                continue
+        # All tool calls approved
+        return None
+
+    @hook_config(can_jump_to=["end"])
+    async def aafter_model(self, state: AgentState, runtime: Runtime) -> dict[str, Any] | None:
+        """
+        Async variant of after_model.
+
+        The tool calls are evaluated concurrently, so a turn with N tool calls
+        costs one approval round-trip instead of N sequential ones. If any
+        evaluation is denied or times out, the remaining evaluations are
+        cancelled and the error propagates.
+
+        Args:
+            state: Current agent state
+            runtime: Agent runtime context
+
+        Returns:
+            Modified state or None
+        """
+        messages, tool_calls = self._pending_tool_calls(state)
+        if not tool_calls:
+            return None
 
+        # Built once; the context is identical for every tool call
+        context = _compact_messages(messages[-3:])  # Last 3 messages
+
+        async def evaluate(tool_call: dict[str, Any]) -> None:
+            tool_name = tool_call.get("name", "unknown_tool")
+            tool_args = tool_call.get("args", {})
+
+            cache_key = None
+            if self._approval_cache is not None:
+                cache_key = _approval_cache_key(tool_name, tool_args)
+                if self._approval_cache.get(cache_key) is not None:
+                    # A byte-identical tool call was approved within the TTL
+                    return
+
+            try:
+                response = await self.velatir_client.evaluate_and_wait(
+                    function_name=tool_name,
+                    args=tool_args,
+                    doc=f"LangChain agent requesting to execute: {tool_name}",
+                    llm_explanation="Tool call from LangChain agent workflow",
+                    metadata=self._tool_metadata(tool_call, context),
+                    polling_interval=self.polling_interval,
+                    timeout=self.timeout,
+                    min_interval=self.min_poll_interval,
+                    max_interval=self.max_poll_interval,
+                    backoff_factor=self.backoff_factor,
+                )
             except VelatirTimeoutError as e:
-                # Timeout waiting for decision
-                raise VelatirTimeoutError(
-                    f"Timeout waiting for approval of tool {tool_name} after {self.timeout}s",
-                    review_task_id=getattr(e, "review_task_id", None),
-                    timeout_seconds=self.timeout,
-                ) from e
+                raise self._timeout_error(tool_name, e) from e
+            self._check_decision(tool_name, response)
+            self._cache_approval(cache_key, response)
+
+        tasks = [asyncio.create_task(evaluate(tc)) for tc in tool_calls]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # Don't leave pending evaluations polling after one is denied;
+            # reap the cancelled tasks so a second failure isn't reported as
+            # a never-retrieved exception
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
 
         # All tool calls approved
         return None
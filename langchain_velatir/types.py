@@ -1,7 +1,7 @@
 """Type definitions for LangChain-Velatir integration."""
 
 from enum import Enum
-from typing import Literal
+from typing import Literal, Optional, Protocol, runtime_checkable
 
 
 class GuardrailMode(str, Enum):
@@ -19,3 +19,21 @@ ReviewTaskState = Literal[
     "Rejected",
     "ChangeRequested",
 ]
+
+
+@runtime_checkable
+class ReviewDecision(Protocol):
+    """Structural type for review decisions returned by the Velatir SDK.
+
+    Both VelatirResponse and TraceResponse satisfy this surface; middleware
+    code is written against it rather than a concrete SDK class, so SDK
+    upgrades that keep the shape keep working.
+    """
+
+    review_task_id: Optional[str]
+
+    @property
+    def is_approved(self) -> bool: ...
+
+    @property
+    def is_rejected(self) -> bool: ...
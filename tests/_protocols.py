@@ -0,0 +1,32 @@
+"""Structural test protocols for the middleware surface.
+
+A single isinstance check against these replaces the pile of per-attribute
+hasattr probes, and doubles as documentation of the shape the tests rely on.
+"""
+
+from typing import Any, Protocol, runtime_checkable
+
+from langchain_velatir.types import GuardrailMode
+
+
+@runtime_checkable
+class GuardrailProtocol(Protocol):
+    """The surface of VelatirGuardrailMiddleware exercised by the tests."""
+
+    velatir_client: object
+    mode: GuardrailMode
+    approval_timeout: float
+    polling_interval: float
+
+    def after_agent(self, *args: Any, **kwargs: Any) -> Any: ...
+
+
+@runtime_checkable
+class HITLProtocol(Protocol):
+    """The surface of VelatirHITLMiddleware exercised by the tests."""
+
+    velatir_client: object
+    polling_interval: float
+    timeout: float
+
+    def after_model(self, *args: Any, **kwargs: Any) -> Any: ...
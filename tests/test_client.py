@@ -0,0 +1,180 @@
+"""Behavior tests for the VelatirClient wrapper, using a stub SDK client."""
+
+import asyncio
+import itertools
+
+import pytest
+
+from langchain_velatir.client import _SDK_CLIENT_POOL, _SDK_CLIENT_REFCOUNTS, VelatirClient
+from langchain_velatir.exceptions import VelatirMiddlewareError, VelatirTimeoutError
+from tests.mock_velatir import ReviewTaskState, VelatirResponse
+
+# Unique base_url per constructed client so tests never share a pooled SDK
+# client (and can observe pool entries appear and disappear in isolation)
+_BASE_URLS = (f"https://test-{n}.invalid" for n in itertools.count())
+
+
+def _pending(review_task_id: str = "rt1") -> VelatirResponse:
+    return VelatirResponse(review_task_id, ReviewTaskState.PENDING)
+
+
+def _approved(review_task_id: str = "rt1") -> VelatirResponse:
+    return VelatirResponse(review_task_id, ReviewTaskState.APPROVED)
+
+
+@pytest.fixture
+def make_client():
+    """Build isolated clients and close them all after the test."""
+    clients = []
+
+    def factory(**kwargs):
+        kwargs.setdefault("api_key", "test-key")
+        kwargs.setdefault("base_url", next(_BASE_URLS))
+        client = VelatirClient(**kwargs)
+        clients.append(client)
+        return client
+
+    yield factory
+
+    async def cleanup():
+        for client in clients:
+            await client.close()
+
+    asyncio.run(cleanup())
+
+
+class TestWaiterCoalescing:
+    """Concurrent waiters on one review task share a single polling loop."""
+
+    async def test_concurrent_waiters_share_one_poll_stream(self, make_client):
+        client = make_client()
+        calls = []
+        approve_after = 3
+
+        async def fake_status(review_task_id, wait=None):
+            calls.append(review_task_id)
+            state = _approved() if len(calls) >= approve_after else _pending()
+            return state
+
+        client._client.get_review_task_status = fake_status
+
+        results = await asyncio.gather(
+            *[
+                client.wait_for_approval("rt1", min_interval=0.01, max_interval=0.02)
+                for _ in range(5)
+            ]
+        )
+
+        assert all(r.is_approved for r in results)
+        # One poll stream for all five waiters: exactly the calls needed to
+        # reach the terminal state, not five of them
+        assert len(calls) == approve_after
+        assert "rt1" not in client._waiters
+        assert "rt1" not in client._poller_tasks
+
+    async def test_last_abandoning_waiter_cancels_poller(self, make_client):
+        client = make_client()
+        calls = []
+
+        async def fake_status(review_task_id, wait=None):
+            calls.append(review_task_id)
+            return _pending()
+
+        client._client.get_review_task_status = fake_status
+
+        with pytest.raises(VelatirTimeoutError):
+            await client.wait_for_approval("rt1", timeout=0.1, min_interval=0.01, max_interval=0.02)
+
+        polled = len(calls)
+        await asyncio.sleep(0.1)
+        assert len(calls) == polled, "poller kept polling after the last waiter left"
+        assert "rt1" not in client._waiters
+        assert "rt1" not in client._poller_tasks
+        assert "rt1" not in client._waiter_counts
+
+
+class TestClientPooling:
+    """The pooled SDK client is shared, refcounted, and closed exactly once."""
+
+    async def test_close_refcounting_and_idempotence(self, make_client):
+        base_url = next(_BASE_URLS)
+        first = make_client(base_url=base_url)
+        second = make_client(base_url=base_url)
+
+        assert first._client is second._client
+        key = first._pool_key
+        assert _SDK_CLIENT_REFCOUNTS[key] == 2
+
+        await first.close()
+        assert key in _SDK_CLIENT_POOL, "pool entry dropped while a holder remains"
+        assert _SDK_CLIENT_REFCOUNTS[key] == 1
+
+        # Closing twice must not decrement the refcount again
+        await first.close()
+        assert _SDK_CLIENT_REFCOUNTS[key] == 1
+
+        await second.close()
+        assert key not in _SDK_CLIENT_POOL
+        assert key not in _SDK_CLIENT_REFCOUNTS
+
+
+class TestCreationDedup:
+    """Identical create calls reuse the in-flight task until it resolves."""
+
+    async def test_dedup_hit_then_post_terminal_miss(self, make_client):
+        client = make_client()
+        created = []
+
+        async def fake_create(**kwargs):
+            created.append(kwargs["function_name"])
+            return _pending()
+
+        client._client.create_review_task = fake_create
+
+        first = await client.create_review_task("tool", {"x": 1})
+        second = await client.create_review_task("tool", {"x": 1})
+        assert second is first
+        assert len(created) == 1
+
+        # Once the task resolves, the same request is genuinely new again
+        client._status_cache_store("rt1", _approved())
+        third = await client.create_review_task("tool", {"x": 1})
+        assert third is not first
+        assert len(created) == 2
+
+
+class TestDecisionReplay:
+    """The on-disk decision store replays recorded decisions offline."""
+
+    async def test_replay_hit_and_miss(self, make_client, tmp_path):
+        path = tmp_path / "decisions.db"
+        recorder = make_client(cache_path=path)
+
+        async def fake_create(**kwargs):
+            return _pending()
+
+        async def fake_status(review_task_id, wait=None):
+            return _approved()
+
+        recorder._client.create_review_task = fake_create
+        recorder._client.get_review_task_status = fake_status
+
+        created = await recorder.create_review_task("tool", {"x": 1}, doc="d")
+        await recorder.wait_for_approval(
+            created.review_task_id, min_interval=0.01, max_interval=0.02
+        )
+        await recorder.close()
+
+        replayer = make_client(cache_path=path, cache_mode="replay")
+
+        async def no_api(**kwargs):
+            raise AssertionError("API called in replay mode")
+
+        replayer._client.create_review_task = no_api
+        replayer._client.get_review_task_status = no_api
+
+        replayed = await replayer.create_review_task("tool", {"x": 1}, doc="d")
+        assert replayed.is_approved
+
+        with pytest.raises(VelatirMiddlewareError):
+            await replayer.create_review_task("tool", {"x": 2}, doc="d")